@@ -1,4 +1,4 @@
-from random import choice
+from random import choices
 
 from shades import Canvas, block_color
 
@@ -13,14 +13,11 @@ palette = [
         (245, 221, 51),
     ]
 ]
+cells = canvas.grid_array(50)
+# pick every cell's color up front, rather than once per cell inside the loop
+colors = choices(palette, k=len(cells))
 
-# for x, y in canvas.grid(50):
-#    color = block_color(choice(palette))
-#    canvas.rectangle_outline(color, (x, y), 40, 20, weight=2)
-
-canvas = canvas.for_grid(50).do(
-    lambda c, p: c.rectangle_outline(choice(palette), p, 40, 20, weight=2)
-)
+canvas = canvas.rectangle_outlines(colors, cells, 40, 20, weight=2)
 
 
 canvas.show()
@@ -8,19 +8,30 @@ from functools import wraps
 
 
 def cast_ints(func: Callable) -> Callable:
+    # argument names and how to cast each int hinted one are worked out once
+    # here, rather than inspecting func every time it's called
+    arg_names = inspect.getfullargspec(func).args
+    casts = {}
+    for kwarg, kwarg_type in func.__annotations__.items():
+        if kwarg_type == int:
+            casts[kwarg] = round
+        elif kwarg_type == Optional[int]:
+            casts[kwarg] = lambda value: value if value is None else round(value)
+        elif kwarg_type == Tuple[int, int]:
+            casts[kwarg] = lambda value: (round(value[0]), round(value[1]))
+        elif kwarg_type == Tuple[int, int, int]:
+            casts[kwarg] = lambda value: (
+                round(value[0]),
+                round(value[1]),
+                round(value[2]),
+            )
+
     @wraps(func)
     def casted_func(*args, **kwargs):
-        kwargs |= dict(zip(inspect.getfullargspec(func).args, args))
-        for kwarg, value in kwargs.items():
-            kwarg_type = func.__annotations__.get(kwarg)
-            if kwarg_type == int:
-                kwargs[kwarg] = round(value)
-            elif kwarg_type == Optional[int] and value is not None:
-                kwargs[kwarg] = round(value)
-            elif kwarg_type == Tuple[int, int]:
-                kwargs[kwarg] = (round(value[0]), round(value[1]))
-            elif kwarg_type == Tuple[int, int, int]:
-                kwargs[kwarg] = (round(value[0]), round(value[1]), round(value[2]))
+        kwargs |= dict(zip(arg_names, args))
+        for kwarg, cast in casts.items():
+            if kwarg in kwargs:
+                kwargs[kwarg] = cast(kwargs[kwarg])
         return func(**kwargs)
 
     return casted_func
@@ -6,11 +6,11 @@ I.e. it works out where a circle should go, and stores information on the
 color and shade etc.
 """
 
-from typing import Callable, Tuple, List, Optional, Generator, DefaultDict
+from typing import Callable, Tuple, List, Optional, Generator, Dict
 from enum import Enum
-from collections import defaultdict
+from itertools import chain, cycle, product, repeat
 
-from PIL import Image
+from PIL import Image, ImageDraw
 import numpy as np
 
 from shades.noise import NoiseField
@@ -31,6 +31,23 @@ class GridIteratorCanvas:
             self.canvas = apply(self.canvas, (x, y))
         return self.canvas
 
+    def draw(self, method: str, shade: Callable, *args, **kwargs) -> "Canvas":
+        """
+        Call the named canvas drawing method at every point on the grid.
+
+        The grid point is passed in straight after the shade (i.e. as the
+        corner, center or start point), followed by any other arguments.
+        So the below is equivalent to calling `do` with a lambda, but skips
+        the per point lambda call and method lookup:
+        ```python
+        canvas = canvas.for_grid(10).draw("square", red, 30)
+        ```
+        """
+        draw_method = getattr(self.canvas, method)
+        for point in self.canvas.grid(self.x_size, self.y_size, self.x_first):
+            draw_method(shade, point, *args, **kwargs)
+        return self.canvas
+
 
 class ColorMode(Enum):
     """
@@ -66,21 +83,33 @@ class Canvas:
         self.x_center: int = int(self.width / 2)
         self.y_center: int = int(self.height / 2)
         self.center: Tuple[int, int] = (self.x_center, self.y_center)
+        # stored as bytes (as it'll be rendered) rather than floats, so
+        # drawing moves an eighth of the memory around (so color is clamped
+        # to 0-255 first, as drawn shades are)
         self._image_array: np.ndarray = np.full(
             (height, width, 3),
-            color,
-            dtype=float,
+            np.clip(color, 0, 255),
+            dtype=np.uint8,
         )
+        # rendered PIL image, kept until drawing next changes the canvas
+        self._image: Optional[Image.Image] = None
+
+    def _rendered_image(self) -> Image:
+        """
+        Render the internal image array as a PIL image, reusing the last
+        render if nothing has been drawn since.
+        """
+        if self._image is None:
+            self._image = Image.fromarray(self._image_array, mode=self.mode.value)
+        return self._image
 
     def image(self) -> Image:
         """
         Return PIL image directly
+
+        (returned as a copy, so that changes to it won't affect the canvas)
         """
-        image = Image.fromarray(
-            self._image_array.astype("uint8"),
-            mode=self.mode.value,
-        )
-        return image
+        return self._rendered_image().copy()
 
     def show(self) -> None:
         """
@@ -89,7 +118,7 @@ class Canvas:
         Renders internal image as PIL and shows using ```Image.show()``` method.
         See PIL documentation for more details.
         """
-        self.image().show()
+        self._rendered_image().show()
 
     def save(self, path: str, format: Optional[str] = None, **kwargs) -> None:
         """
@@ -97,129 +126,216 @@ class Canvas:
 
         Any additional keyword arguments will be passed to image writer.
         """
-        self.image().save(path, format=format, **kwargs)
+        self._rendered_image().save(path, format=format, **kwargs)
+
+    def _shade_pixels(
+        self,
+        shade: Callable,
+        corner: Tuple[int, int],
+        width: int,
+        height: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Calculates shades for the width by height region at corner, clamped
+        to 0 - 255 so that out of range colors (e.g. from custom shades)
+        saturate rather than wrapping around when stored as bytes.
+
+        If given, the shades are written straight into out (e.g. a region of
+        the image array) as part of clamping them.
+        """
+        return np.clip(shade(corner, width, height), 0, 255, out=out, casting="unsafe")
 
-    def _add_to_image_array(self, array: np.array, shade: Callable) -> None:
+    def _add_to_image_array(
+        self,
+        array: np.array,
+        shade: Callable,
+        bbox: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
         """
         Calculates shades for the array (assumed 0 & 1 only values) and then draws onto
         the canvas.
+
+        If the (left, top, right, bottom) bounding box of the shape is already
+        known it can be passed as bbox, to skip scanning the array for it.
+        """
+        mask = array == 1
+        if bbox is None:
+            non_zeros = np.argwhere(mask)
+            if len(non_zeros) == 0:  # we have no image to draw
+                return
+            min_y, min_x = non_zeros.min(axis=0)
+            max_y, max_x = non_zeros.max(axis=0)
+            bbox = (min_x, min_y, max_x + 1, max_y + 1)
+        left, top, right, bottom = bbox
+        # only the bounding box of the shape is shaded and composited
+        self._add_mask_to_image_array(mask[top:bottom, left:right], (left, top), shade)
+
+    def _add_points_to_image_array(
+        self, xs: np.ndarray, ys: np.ndarray, shade: Callable
+    ) -> None:
         """
-        non_zeros = np.argwhere(array == 1)
-        try:
-            max_y = non_zeros[:, 0].max()
-            min_y = non_zeros[:, 0].min()
-            max_x = non_zeros[:, 1].max()
-            min_x = non_zeros[:, 1].min()
-        except ValueError:  # we have no image to draw
+        Calculates shades for the (x, y) points (skipping those off the canvas)
+        and then draws them onto the canvas.
+
+        Unlike _add_to_image_array, this only works within the bounding box
+        of the points, rather than on a mask the size of the whole canvas.
+        """
+        on_canvas = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[on_canvas], ys[on_canvas]
+        if len(xs) == 0:  # we have no image to draw
             return
+        left, top = xs.min(), ys.min()
+        width, height = xs.max() - left + 1, ys.max() - top + 1
+        mask = np.zeros((height, width), dtype=bool)
+        mask[ys - top, xs - left] = True
+        self._add_mask_to_image_array(mask, (left, top), shade)
+
+    def _add_mask_to_image_array(
+        self, mask: np.ndarray, corner: Tuple[int, int], shade: Callable
+    ) -> None:
+        """
+        Calculates shades for the region of the canvas covered by mask (a
+        boolean array with its top left at corner) and then draws them onto
+        the canvas where mask is True.
 
-        shade_array = shade((min_x, min_y), max_x - min_x, max_y - min_y)
-        shade_array = np.pad(
-            shade_array,
-            pad_width=(
-                (min_y, self.height - max_y),
-                (min_x, self.width - max_x),
-                (0, 0),
-            ),
-            mode="constant",
-            constant_values=0,
-        )
-        shade_array *= np.repeat(array[:, :, np.newaxis], 3, axis=2)
-        mask = np.any(shade_array != 0, axis=-1)
-        self._image_array = np.where(
-            mask[:, :, np.newaxis], shade_array, self._image_array
+        Unlike _add_to_image_array, this only works on the region itself,
+        rather than on a mask the size of the whole canvas.
+        """
+        if not mask.any():  # we have no image to draw
+            return
+        left, top = corner
+        height, width = mask.shape
+        np.copyto(
+            self._image_array[top : top + height, left : left + width],
+            self._shade_pixels(shade, (left, top), width, height),
+            where=mask[:, :, np.newaxis],
+            casting="unsafe",
         )
+        self._image = None
 
-    def _shift_array_points(
-        self, array: np.array, warp_noise: Tuple[NoiseField, NoiseField], shift: int
+    def _polygon_mask(
+        self,
+        points: np.ndarray,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
     ) -> np.ndarray:
         """
-        Move points in array based on x and y noise fields.
-
-        Shift determines relation between a noise output of "1"
-        and movement accross the canvas
-
-        This is, at least currently, implemented as a very slow operation,
-        iterating over all non-zero points, and moving them. It'll also
-        potentially leave "gaps" - so use carefully, ideally on outlines
-        of shapes rather than no the final shape.
-        """
-        new_array: np.ndarray = np.zeros((self.height, self.width))
-        height, width = array.shape
-        warp_noise = [i.noise_range((0, 0), height, width) for i in warp_noise]
-        warp_noise = [(i - 0.5) * 2 * shift for i in warp_noise]
-        y_noise, x_noise = warp_noise
-        y_i, x_i = np.indices(array.shape)
-        y_noise = y_noise.astype(int) + y_i
-        x_noise = x_noise.astype(int) + x_i
-        new_locs = np.stack((y_noise, x_noise))
-        to_move = np.argwhere(array == 1)
-        for y, x in to_move:
-            new_x = new_locs[0][y][x]
-            new_y = new_locs[1][y][x]
-            new_array[new_y][new_x] = 1
-        return new_array
+        Boolean mask of the pixels inside the polygon (edges included), for
+        the width by height region of the canvas with its top left at left, top.
+
+        Filled using PIL's (C based) polygon scanline fill.
+        """
+        mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(mask).polygon((points - (left, top)).ravel().tolist(), fill=1)
+        return np.asarray(mask, dtype=bool)
 
     def _points_in_line(
         self, start: Tuple[int, int], end: Tuple[int, int]
-    ) -> Generator[Tuple[int, int], None, None]:
+    ) -> np.ndarray:
         """
-        Get the points in a line, iterating across the y axis
+        Get the (x, y) points in a line, one per step along its longer axis
+
+        Points are worked out as in Bresenham's algorithm, with integer
+        arithmetic only (rounding each step's offset to the nearest pixel),
+        but for every step at once rather than a step at a time.
         """
-        if end[1] == start[1] and end[0] == start[0]:  # point is 0 length
-            yield end
-            return
-        if end[1] == start[1]:  # point only moves over x axis
-            x_dir = 1 if start[0] < end[0] else -1
-            for x in range(start[0], end[0] + 1, x_dir):
-                yield (x, start[1])
+        (x_start, y_start), (x_end, y_end) = start, end
+        length = max(abs(x_end - x_start), abs(y_end - y_start))
+        steps = np.arange(length + 1)[:, np.newaxis]
+        deltas = np.array([x_end - x_start, y_end - y_start])
+        return start + (2 * steps * deltas + length) // (2 * max(length, 1))
+
+    def _weighted_points(
+        self, points: np.ndarray, weight: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the xs and ys covered by drawing each (x, y) point as a weight
+        by weight square (with the point at its top left)
+        """
+        x_offsets, y_offsets = np.divmod(np.arange(weight**2), weight)
+        xs = (points[:, 0, np.newaxis] + x_offsets).ravel()
+        ys = (points[:, 1, np.newaxis] + y_offsets).ravel()
+        return xs, ys
+
+    def _draw_points(
+        self,
+        shade: Callable,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        rotation: int,
+        rotate_on: Tuple[int, int],
+    ) -> None:
+        """
+        Draw the (x, y) points with the given shade, after turning them
+        rotation degrees around rotate_on
+        """
+        if rotation == 0:
+            self._add_points_to_image_array(xs, ys, shade)
             return
-        if end[0] == start[0]:  # point only moves over y axis
-            y_dir = 1 if start[1] < end[1] else -1
-            for y in range(start[1], end[1] + 1, y_dir):
-                yield (start[0], y)
+        if len(xs) == 0:  # we have no image to draw
             return
-        slope = (end[1] - start[1]) / (end[0] - start[0])
-        intercept = start[1] - slope * start[0]
-        y_start = min(start[1], end[1])
-        y_end = max(start[1], end[1])
-        y_dir = 1 if y_start < y_end else -1
-        for y in range(y_start, y_end + 1, y_dir):
-            x = int(round(slope * y + intercept))
-            yield (x, y)
+        left, top = xs.min(), ys.min()
+        mask = np.zeros((ys.max() - top + 1, xs.max() - left + 1), dtype=bool)
+        mask[ys - top, xs - left] = True
+        mask, corner = self._rotate(mask, (left, top), rotate_on, rotation)
+        self._add_mask_to_image_array(mask, corner, shade)
 
     def _rotate(
-        self, array: np.ndarray, center: Tuple[int, int], degrees: int
-    ) -> np.ndarray:
+        self,
+        mask: np.ndarray,
+        corner: Tuple[int, int],
+        center: Tuple[int, int],
+        degrees: int,
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
-        Rotate array by degrees around center
+        Rotate mask (a boolean array with its top left at corner) by degrees
+        around center.
+
+        Returns the rotated mask along with its top left corner, covering
+        only the part of the canvas that the rotated mask can reach.
         """
         radians = np.radians(degrees)
-        y_center, x_center = center
-        y_size, x_size = array.shape
-        i, j = np.ogrid[:y_size, :x_size]
-        i_rotated = (
-            np.cos(radians) * (i - y_center)
-            - np.sin(radians) * (j - x_center)
-            + y_center
+        cos, sin = np.cos(radians), np.sin(radians)
+        x_center, y_center = center
+        left, top = corner
+        height, width = mask.shape
+        # turning the mask's corners the other way bounds where it ends up
+        corner_ys = np.array([top, top, top + height, top + height]) - y_center
+        corner_xs = np.array([left, left + width, left, left + width]) - x_center
+        rotated_ys = cos * corner_ys + sin * corner_xs + y_center
+        rotated_xs = cos * corner_xs - sin * corner_ys + x_center
+        new_top = min(max(int(np.floor(rotated_ys.min())) - 1, 0), self.height)
+        new_bottom = max(min(int(np.ceil(rotated_ys.max())) + 1, self.height), new_top)
+        new_left = min(max(int(np.floor(rotated_xs.min())) - 1, 0), self.width)
+        new_right = max(min(int(np.ceil(rotated_xs.max())) + 1, self.width), new_left)
+        # then every pixel there looks up the point of the mask it came from,
+        # which PIL's affine transform does in one nearest neighbour pass.
+        # PIL samples at pixel centres and floors, so shift by half a pixel
+        # to round to the nearest source point instead
+        row_offset = (
+            cos * (new_top - y_center) - sin * (new_left - x_center) + y_center - top
         )
-        j_rotated = (
-            np.sin(radians) * (i - y_center)
-            + np.cos(radians) * (j - x_center)
-            + x_center
+        column_offset = (
+            sin * (new_top - y_center) + cos * (new_left - x_center) + x_center - left
         )
-        i_rotated = np.round(i_rotated).astype(int)
-        j_rotated = np.round(j_rotated).astype(int)
-        rotated_grid = np.zeros_like(array)
-        mask = (
-            (i_rotated >= 0)
-            & (i_rotated < y_size)
-            & (j_rotated >= 0)
-            & (j_rotated < x_size)
+        rotated = Image.fromarray(mask.astype(np.uint8), mode="L").transform(
+            (new_right - new_left, new_bottom - new_top),
+            Image.AFFINE,
+            (
+                cos,
+                sin,
+                column_offset + 0.5 - (cos + sin) / 2,
+                -sin,
+                cos,
+                row_offset + 0.5 - (cos - sin) / 2,
+            ),
+            resample=Image.NEAREST,
         )
-        rotated_grid[mask] = array[i_rotated[mask], j_rotated[mask]]
-
-        return rotated_grid
+        rotated = np.asarray(rotated, dtype=bool)
+        return rotated, (new_left, new_top)
 
     @cast_ints
     def for_grid(
@@ -285,16 +401,53 @@ class Canvas:
         Returned coordinates will always be (x, y) regardless of `x_first`.
         """
         y_size = y_size or x_size
-        first, second = (
-            (self.width, self.height) if x_first else (self.height, self.width)
+        xs = range(0, self.width + 1, x_size)
+        ys = range(0, self.height + 1, y_size)
+        # the tuples are built by itertools in C, rather than a nested loop
+        if x_first:
+            yield from product(xs, ys)
+        else:
+            yield from zip(
+                cycle(xs), chain.from_iterable(repeat(y, len(xs)) for y in ys)
+            )
+
+    @cast_ints
+    def grid_array(
+        self,
+        x_size: int,
+        y_size: Optional[int] = None,
+        x_first: bool = True,
+    ) -> np.ndarray:
+        """
+        Array version of `grid`, returning every coordinate at once as an
+        (N, 2) array of x, y rows (in the same order `grid` would yield them).
+
+        Handy for passing a whole grid to batched methods such as
+        `rectangle_outlines`, or for working on the coordinates with numpy:
+        ```python
+        points = canvas.grid_array(10)
+        xs, ys = points[:, 0], points[:, 1]
+        ```
+        """
+        y_size = y_size or x_size
+        xs = np.arange(0, self.width + 1, x_size)
+        ys = np.arange(0, self.height + 1, y_size)
+        x_grid, y_grid = np.meshgrid(xs, ys, indexing="ij" if x_first else "xy")
+        return np.stack([x_grid.ravel(), y_grid.ravel()], axis=1)
+
+    def fill(self, shade: Callable) -> "Canvas":
+        """
+        Fill the whole canvas with the given shade.
+
+        The shade is worked out for the whole canvas in one go and written
+        straight over the image, so this skips the shape masking that
+        drawing a canvas sized rectangle would go through.
+        """
+        self._shade_pixels(
+            shade, (0, 0), self.width, self.height, out=self._image_array
         )
-        first_i, second_i = (x_size, y_size) if x_first else (y_size, x_size)
-        for i in range(0, first + 1, first_i):
-            for j in range(0, second + 1, second_i):
-                if x_first:
-                    yield (i, j)
-                else:
-                    yield (j, i)
+        self._image = None
+        return self
 
     @cast_ints
     def rectangle(
@@ -303,19 +456,37 @@ class Canvas:
         corner: Tuple[int, int],
         width: int,
         height: int,
+        rotation: int = 0,
+        rotate_on: Optional[Tuple[int, int]] = None,
     ) -> "Canvas":
         """
         Draw a rectangle on the canvas using the given shade.
 
         corner point corresponds to top left corner of the rectangle.
+
+        rotation (in degrees) turns the rectangle around rotate_on,
+        which defaults to the corner.
         """
         x, y = corner
-        array: np.ndarray = np.zeros((self.height, self.width))
-        array[y : y + height, x : x + width] = 1
-        if rotation != 0:
-            rotate_on = rotate_on or corner
-            array = self._rotate(array, rotate_on, rotation)
-        self._add_to_image_array(array, shade)
+        # clip to the canvas, so negative corners don't wrap round to the end
+        top, bottom = max(y, 0), min(max(y + height, 0), self.height)
+        left, right = max(x, 0), min(max(x + width, 0), self.width)
+        if rotation == 0:
+            # an unrotated rectangle is just a slice, so it can be shaded
+            # and written straight into place without a canvas sized mask
+            if top < bottom and left < right:
+                self._shade_pixels(
+                    shade,
+                    (left, top),
+                    right - left,
+                    bottom - top,
+                    out=self._image_array[top:bottom, left:right],
+                )
+                self._image = None
+            return self
+        mask = np.ones((max(height, 0), max(width, 0)), dtype=bool)
+        mask, corner = self._rotate(mask, corner, rotate_on or corner, rotation)
+        self._add_mask_to_image_array(mask, corner, shade)
         return self
 
     @cast_ints
@@ -333,30 +504,69 @@ class Canvas:
         corner point corresponds to top left corner of the rectangle.
         """
         x, y = corner
-        self.line(
-            shade,
-            corner,
-            (x, y + height),
-            weight=weight,
-        )
-        self.line(
+        return self.polygon_outline(
             shade,
             corner,
             (x + width, y),
-            weight=weight,
-        )
-        self.line(
-            shade,
-            (x, y + height),
             (x + width, y + height),
+            (x, y + height),
             weight=weight,
         )
-        self.line(
-            shade,
-            (x + width, y),
-            (x + width, y + height),
-            weight=weight,
+
+    @cast_ints
+    def rectangle_outlines(
+        self,
+        shades: List[Callable],
+        corners: List[Tuple[int, int]],
+        width: int,
+        height: int,
+        weight: int = 1,
+    ) -> "Canvas":
+        """
+        Draw many same sized rectangle outlines on the canvas in one go.
+
+        Each corner is drawn with the shade at the same position in shades.
+        Outlines sharing a shade are drawn onto the canvas together, which
+        is a lot quicker than calling `rectangle_outline` in a loop, but
+        means that where outlines overlap, shades are layered in the order
+        they first appear in shades. So in the below, the blue outline is
+        drawn over both of the red ones it overlaps:
+
+        ```python
+        canvas.rectangle_outlines(
+            [red, blue, red], [(0, 0), (30, 0), (60, 0)], 40, 20
         )
+        ```
+        """
+        arrays: Dict[Callable, np.ndarray] = {}
+        bboxes: Dict[Callable, Tuple[int, int, int, int]] = {}
+        for shade, (x, y) in zip(shades, corners):
+            if shade not in arrays:
+                arrays[shade] = np.zeros((self.height, self.width), dtype=bool)
+                bboxes[shade] = (self.width, self.height, 0, 0)
+            array = arrays[shade]
+            x, y = round(x), round(y)
+            # every edge is clamped at 0, since negative slice bounds would
+            # otherwise count back from the far side of the canvas
+            left, top = max(x, 0), max(y, 0)
+            inner_right, inner_bottom = max(x + width, 0), max(y + height, 0)
+            right = max(x + width + weight, 0)
+            bottom = max(y + height + weight, 0)
+            array[top : max(y + weight, 0), left:right] = True
+            array[top:bottom, left : max(x + weight, 0)] = True
+            array[inner_bottom:bottom, left:right] = True
+            array[top:bottom, inner_right:right] = True
+            # keep track of where each shade's outlines are as they're drawn,
+            # so they don't need finding again with a scan of the whole array
+            min_x, min_y, max_x, max_y = bboxes[shade]
+            bboxes[shade] = (
+                min(min_x, left),
+                min(min_y, top),
+                max(max_x, min(right, self.width)),
+                max(max_y, min(bottom, self.height)),
+            )
+        for shade, array in arrays.items():
+            self._add_to_image_array(array, shade, bboxes[shade])
         return self
 
     @cast_ints
@@ -403,17 +613,17 @@ class Canvas:
         start: Tuple[int, int],
         end: Tuple[int, int],
         weight: int = 1,
+        rotation: int = 0,
+        rotate_on: Optional[Tuple[int, int]] = None,
     ) -> "Canvas":
         """
         Draw a line on the canvas using the given shade.
+
+        rotation (in degrees) turns the line around rotate_on,
+        which defaults to the start point.
         """
-        array: np.ndarray = np.zeros((self.height, self.width))
-        for x, y in self._points_in_line(start, end):
-            array[y : y + weight, x : x + weight] = 1
-        if rotation != 0:
-            rotate_on = rotate_on or start
-            array = self._rotate(array, rotate_on, rotation)
-        self._add_to_image_array(array, shade)
+        xs, ys = self._weighted_points(self._points_in_line(start, end), weight)
+        self._draw_points(shade, xs, ys, rotation, rotate_on or start)
         return self
 
     @cast_ints
@@ -430,41 +640,58 @@ class Canvas:
         Draw a line, warped by noise fields, on the canvas using the
         given shade.
         """
-        array: np.ndarray = np.zeros((self.height, self.width))
-        for x, y in self._points_in_line(start, end):
-            array[y, x : x + weight] = 1
-        array = self._shift_array_points(array, warp_noise, shift)
-        self._add_to_image_array(array, shade)
+        xs, ys = self._points_in_line(start, end).T
+        # points are moved before being given their weight, so that the
+        # pixels across a thick line move together rather than scattering
+        x_noise, y_noise = warp_noise
+        x_shift = (x_noise.noise_points(xs, ys) - 0.5) * 2 * shift
+        y_shift = (y_noise.noise_points(xs, ys) - 0.5) * 2 * shift
+        xs = xs + x_shift.astype(int)
+        ys = ys + y_shift.astype(int)
+        xs = (xs[:, np.newaxis] + np.arange(weight)).ravel()
+        ys = np.repeat(ys, weight)
+        self._add_points_to_image_array(xs, ys, shade)
         return self
 
     def polygon(
         self,
         shade: Callable,
         *points: Tuple[int, int],
+        rotation: int = 0,
+        rotate_on: Optional[Tuple[int, int]] = None,
     ) -> "Canvas":
         """
         Draw a polygon on canvas with the given shade.
 
-        Uses ray tracing to determine points within shape, based on matching
-        between first points, to second, to third (etc) to first.
-        """
-        points = [(int(i[0]), int(i[1])) for i in points]  # casting ints
-        pairs = [
-            (point, points[(i + 1) % len(points)]) for i, point in enumerate(points)
-        ]
-        y_to_x_points: DefaultDict[int, List[int]] = defaultdict(lambda: [])
-        for pair in pairs:
-            for line_point in self._points_in_line(*pair):
-                y_to_x_points[line_point[1]].append(line_point[0])
-        array: np.ndarray = np.zeros((self.height, self.width))
-        for y in y_to_x_points:
-            xs = y_to_x_points[y]
-            for start_x, end_x in zip(xs[::2], xs[1::2]):
-                array[y, start_x:end_x] = 1
-        if rotation != 0:
-            rotate_on = rotate_on or points[0]
-            array = self._rotate(array, rotate_on, rotation)
-        self._add_to_image_array(array, shade)
+        The shape is made by joining the first point, to the second, to the
+        third (etc) and back to the first, then filling everything inside.
+
+        rotation (in degrees) turns the polygon around rotate_on,
+        which defaults to the first point.
+        """
+        # casting ints, as an (n, 2) array in one go
+        points = np.asarray(points, dtype=int)
+        rotation = int(rotation)
+        if rotate_on:
+            rotate_on = (int(rotate_on[0]), int(rotate_on[1]))
+        if len(points) == 0:  # we have no image to draw
+            return self
+        (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+        if rotation == 0:
+            # clip the polygon's bounding box to the canvas
+            left, right = max(min_x, 0), min(max_x + 1, self.width)
+            top, bottom = max(min_y, 0), min(max_y + 1, self.height)
+            if left < right and top < bottom:
+                mask = self._polygon_mask(points, left, top, right - left, bottom - top)
+                self._add_mask_to_image_array(mask, (left, top), shade)
+            return self
+        mask = self._polygon_mask(
+            points, min_x, min_y, max_x - min_x + 1, max_y - min_y + 1
+        )
+        mask, corner = self._rotate(
+            mask, (min_x, min_y), rotate_on or tuple(points[0]), rotation
+        )
+        self._add_mask_to_image_array(mask, corner, shade)
         return self
 
     def warped_polygon(
@@ -479,50 +706,88 @@ class Canvas:
         """
         Draw a polygon, warped by noise, on canvas with the given shade.
 
-        Uses ray tracing to determine points within shape, based on matching
-        between first points, to second, to third (etc) to first.
-        """
-        # casting ints
-        points = [int(i) for i in points]
-        rotation = int(rotation)
-        if rotate_on:
-            rotate_on = (int(rotate_on[0]), int(rotate_on[1]))
-        pairs = [
-            (point, points[(i + 1) % len(points)]) for i, point in enumerate(points)
-        ]
-        new_points: List[Tuple[int, int]] = []
-        for pair in pairs:
-            for point in self._points_in_line(*pair):
-                new_points.append(point)
-        return self.polygon(shade, *new_points, warp_noise, shift, rotation, rotate_on)
+        Every point along the polygon's edges is moved by up to shift
+        pixels, based on the x and y warp_noise fields, before filling.
+
+        The shape is made by joining the first point, to the second, to the
+        third (etc) and back to the first, then filling everything inside.
+        """
+        # casting ints, as an (n, 2) array in one go
+        points = np.asarray(points, dtype=int)
+        pairs = zip(points, np.roll(points, -1, axis=0))
+        edge_points = np.concatenate([self._points_in_line(*pair) for pair in pairs])
+        xs, ys = edge_points[:, 0], edge_points[:, 1]
+        x_noise, y_noise = warp_noise
+        new_points = np.stack(
+            [
+                xs + (x_noise.noise_points(xs, ys) - 0.5) * 2 * shift,
+                ys + (y_noise.noise_points(xs, ys) - 0.5) * 2 * shift,
+            ],
+            axis=1,
+        )
+        return self.polygon(
+            shade,
+            *new_points,
+            rotation=rotation,
+            rotate_on=rotate_on or tuple(points[0]),
+        )
 
     def polygon_outline(
         self,
         shade: Callable,
         *points: Tuple[int, int],
         weight: int = 1,
+        rotation: int = 0,
+        rotate_on: Optional[Tuple[int, int]] = None,
     ) -> "Canvas":
         """
         Draw a polygon outline on canvas with the given shade.
 
-        Uses ray tracing to determine points within shape, based on matching
-        between first points, to second, to third (etc) to first.
+        The outline joins the first point, to the second, to the third (etc)
+        and back to the first.
+
+        rotation (in degrees) turns the outline around rotate_on,
+        which defaults to the first point.
         """
-        # casting ints
-        points = [(int(i[0]), int(i[1])) for i in points]
+        # casting ints, as an (n, 2) array in one go
+        points = np.asarray(points, dtype=int)
         rotation = int(rotation)
         if rotate_on:
             rotate_on = (int(rotate_on[0]), int(rotate_on[1]))
 
         weight = int(weight)
-        pairs = [
-            (point, points[(i + 1) % len(points)]) for i, point in enumerate(points)
-        ]
+        if len(points) == 0:  # we have no image to draw
+            return self
+        pairs = zip(points, np.roll(points, -1, axis=0))
+        # every edge is drawn in one go, rather than as a line at a time
+        edge_points = np.concatenate([self._points_in_line(*pair) for pair in pairs])
+        xs, ys = self._weighted_points(edge_points, weight)
+        self._draw_points(shade, xs, ys, rotation, rotate_on or tuple(points[0]))
+        return self
+
+    def warped_polygon_outline(
+        self,
+        shade: Callable,
+        *points: Tuple[int, int],
+        warp_noise: Tuple[NoiseField, NoiseField],
+        shift: int,
+        weight: int = 1,
+    ) -> "Canvas":
+        """
+        Draw a polygon outline, warped by noise, on canvas with the given shade.
+
+        Lines go from the first point, to second, to third (etc) to first.
+        """
+        # casting ints, as an (n, 2) array in one go
+        points = np.asarray(points, dtype=int)
+        pairs = zip(points, np.roll(points, -1, axis=0))
         for point_one, point_two in pairs:
-            self.line(
+            self.warped_line(
                 shade,
                 start=point_one,
                 end=point_two,
+                warp_noise=warp_noise,
+                shift=shift,
                 weight=weight,
             )
         return self
@@ -553,12 +818,13 @@ class Canvas:
         rotate_on: Optional[Tuple[int, int]] = None,
         weight: int = 1,
     ) -> "Canvas":
-        return self.polyon_outline(
+        return self.polygon_outline(
             shade,
             point_one,
             point_two,
             point_three,
             rotation=rotation,
+            rotate_on=rotate_on,
             weight=weight,
         )
 
@@ -575,11 +841,29 @@ class Canvas:
         rotate_on: Optional[Tuple[int, int]] = None,
         weight: int = 1,
     ) -> "Canvas":
-        return self.polygon_outline(
+        """
+        Draw a triangle outline, warped by noise, on canvas with the given shade.
+
+        rotation (in degrees) turns the triangle's corners around rotate_on,
+        which defaults to the first point, before the outline is warped.
+        """
+        points = [point_one, point_two, point_three]
+        if rotation != 0:
+            x_center, y_center = rotate_on or point_one
+            radians = np.radians(rotation)
+            cos, sin = np.cos(radians), np.sin(radians)
+            points = [
+                (
+                    round(x_center + cos * (x - x_center) - sin * (y - y_center)),
+                    round(y_center + sin * (x - x_center) + cos * (y - y_center)),
+                )
+                for x, y in points
+            ]
+        return self.warped_polygon_outline(
             shade,
-            point_one,
-            point_two,
-            point_three,
+            *points,
+            warp_noise=warp_noise,
+            shift=shift,
             weight=weight,
         )
 
@@ -594,21 +878,26 @@ class Canvas:
         Draw a circle on canvas with the given shade.
         """
         x, y = center
-        i, j = np.ogrid[: self.height, : self.width]
-        array: np.ndarray = np.zeros((self.height, self.width))
-        array[(i - y) ** 2 + (j - x) ** 2 <= radius**2] = 1
-        self._add_to_image_array(array, shade)
+        # only the circle's bounding box (clipped to the canvas) can be inside
+        # it, so the mask, shade and compositing all stay within that box
+        top, bottom = max(y - radius, 0), min(y + radius + 1, self.height)
+        left, right = max(x - radius, 0), min(x + radius + 1, self.width)
+        if top >= bottom or left >= right:
+            return self
+        i, j = np.ogrid[top:bottom, left:right]
+        mask = (i - y) ** 2 + (j - x) ** 2 <= radius**2
+        self._add_mask_to_image_array(mask, (left, top), shade)
         return self
 
-    def _circle_edge_points(self, center: Tuple[int, int], radius: int):
-        circumference = radius * 2
-        return [
-            (
-                center[0] + radius * np.cos(2 * np.pi * i / circumference),
-                center[1] + radius * np.sin(2 * np.pi * i / circumference),
-            )
-            for i in range(circumference)
-        ]
+    def _circle_edge_points(self, center: Tuple[int, int], radius: int) -> np.ndarray:
+        """
+        Get (x, y) points evenly spaced around the edge of a circle
+        """
+        angles = np.linspace(0, 2 * np.pi, radius * 2, endpoint=False)
+        return np.stack(
+            [center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)],
+            axis=1,
+        )
 
     @cast_ints
     def warped_circle(
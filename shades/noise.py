@@ -7,12 +7,112 @@ Functions and classes relating to Shades' NoiseField
 import random
 import math
 
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
 from numpy.typing import ArrayLike
 
+# number of points the perlin kernel works on at a time
+_BLOCK_SIZE = 2**16
+
+# x and y components of the perlin gradient vectors, (0, 1), (0, -1), (1, 0)
+# & (-1, 0), picked between by the low two bits of a permutation table hash
+_GRADIENTS_X = np.array([0, 0, 1, -1], dtype=np.float32)
+_GRADIENTS_Y = np.array([1, -1, 0, 0], dtype=np.float32)
+
+
+def _lerp(a_array: ArrayLike, b_array: ArrayLike, x_array: ArrayLike) -> ArrayLike:
+    """
+    linear interpolation
+
+    computed in place in b_array (which is returned) so the perlin
+    combination doesn't allocate a temporary array for every step
+    """
+    b_array -= a_array
+    b_array *= x_array
+    b_array += a_array
+    return b_array
+
+
+def _fade(t_array: ArrayLike) -> ArrayLike:
+    "6t^5 - 15t^4 + 10t^3 (in Horner form, so no powers are needed)"
+    return t_array * t_array * t_array * ((t_array * 6 - 15) * t_array + 10)
+
+
+def _gradient(
+    gradients: Tuple[ArrayLike, ArrayLike],
+    index: ArrayLike,
+    x_array: ArrayLike,
+    y_array: ArrayLike,
+) -> ArrayLike:
+    """
+    dot product of (x,y) with the gradient vectors found at index in
+    gradients (x and y components looked up for each permutation table entry)
+    """
+    gradients_x, gradients_y = gradients
+    result = gradients_x[index] * x_array
+    result += gradients_y[index] * y_array
+    return result
+
+
+def _perlin(
+    x_lin: ArrayLike,
+    y_lin: ArrayLike,
+    permutation: ArrayLike,
+    out: Optional[ArrayLike] = None,
+) -> ArrayLike:
+    """
+    Perlin noise for the grid spanned by x_lin and y_lin, using the given
+    (length 256) permutation table.
+
+    The noise is worked out a block of rows at a time and written into out
+    (a new array, if not given), so that the temporaries for each step stay
+    small enough to sit in cache rather than each being a full sized grid.
+
+    credit to tgirod for stack overflow on numpy perlin noise (most of this code from answer)
+    https://stackoverflow.com/questions/42147776/producing-2d-perlin-noise-with-numpy
+    """
+    # x as a row and y as a column, so that everything below only becomes
+    # a full grid where it has to (via broadcasting) rather than meshgrid-ing
+    x_grid = np.asarray(x_lin)[np.newaxis, :]
+    y_grid = np.asarray(y_lin)[:, np.newaxis]
+    height, width = y_grid.shape[0], x_grid.shape[1]
+    if out is None:
+        out = np.empty((height, width), dtype=np.float32)
+    p = permutation
+    # gradient vector for every table entry, so corners need a single lookup
+    gradients = (_GRADIENTS_X[p & 3], _GRADIENTS_Y[p & 3])
+    # coordinates of the top-left, internal coordinates and fade factors
+    # along x are the same for every block of rows
+    x_i = np.floor(x_grid).astype(int)
+    x_f = x_grid % 1
+    u_array = _fade(x_f)
+    # hashes of the left and right corner columns, shared by top and bottom
+    left = p[x_i & 255]
+    right = p[(x_i + 1) & 255]
+    # internal coordinates relative to the right hand corners
+    x_f_1 = x_f - 1
+    rows = max(1, _BLOCK_SIZE // max(width, 1))
+    for start in range(0, height, rows):
+        y_block = y_grid[start : start + rows]
+        y_i = np.floor(y_block).astype(int)
+        y_f = y_block % 1
+        v_array = _fade(y_f)
+        y_f_1 = y_f - 1
+        # noise components
+        n00 = _gradient(gradients, (left + y_i) & 255, x_f, y_f)
+        n01 = _gradient(gradients, (left + y_i + 1) & 255, x_f, y_f_1)
+        n11 = _gradient(gradients, (right + y_i + 1) & 255, x_f_1, y_f_1)
+        n10 = _gradient(gradients, (right + y_i) & 255, x_f_1, y_f)
+        # combine noises (each lerp reuses the buffer of its second argument)
+        x_1 = _lerp(n00, n10, u_array)
+        x_2 = _lerp(n01, n11, u_array)
+        field = _lerp(x_1, x_2, v_array)
+        field += 0.5
+        out[start : start + rows] = field
+    return out
+
 
 class NoiseField:
     """
@@ -28,10 +128,19 @@ class NoiseField:
         else:
             self.seed = seed
         self.scale = scale
-        size = 10
-        self.x_lin = np.linspace(0, (size * self.scale), size, endpoint=False)
-        self.y_lin = np.linspace(0, (size * self.scale), size, endpoint=False)
-        self.field = self._perlin_field(self.x_lin, self.y_lin)
+        # permutation table, built once per seed from a local generator
+        # so that the global numpy random state is left alone
+        permutation = np.random.default_rng(self.seed).permutation(256)
+        self._permutation = permutation.astype(np.uint8)
+        # the field is only generated once noise is first asked for, so that
+        # it can be made at the size needed straight away
+        self.x_lin = None
+        self.y_lin = None
+        self.field = None
+        # field is a view onto a region (starting at _field_origin) of this
+        # possibly larger array, so that extending it rarely needs a copy
+        self._field_buffer = None
+        self._field_origin = (0, 0)
         self.x_negative_buffer = 0
         self.y_negative_buffer = 0
         self.buffer_chunks = 500
@@ -42,57 +151,126 @@ class NoiseField:
         """
         return int(math.ceil(to_round / nearest_n)) * nearest_n
 
+    def _lin(self, start: int, length: int) -> ArrayLike:
+        """
+        Internal function to get the noise coordinates of length pixels,
+        starting at pixel start.
+
+        Coordinates are worked out from the pixel index (rather than from
+        the current edge of the field) so that buffered strips line up exactly.
+        Noise is only ever used to nudge 8 bit colors, so single precision
+        is plenty and halves the memory the field (and its maths) moves.
+        """
+        return (np.arange(start, start + length) * self.scale).astype(np.float32)
+
+    def _reserve_field(
+        self, rows_above: int, rows_below: int, columns_left: int, columns_right: int
+    ) -> None:
+        """
+        Makes sure the field buffer has room around the field for the given
+        number of extra rows and columns on each side.
+
+        When it doesn't, a new buffer is made where every side that is short
+        gets at least as much room as the field is long along that axis, so
+        that repeatedly extending the field (in any direction) only copies the
+        existing noise an amortised constant number of times.
+        """
+        y_origin, x_origin = self._field_origin
+        height, width = self.field.shape
+        buffer_height, buffer_width = self._field_buffer.shape
+        room_below = buffer_height - y_origin - height
+        room_right = buffer_width - x_origin - width
+        if (
+            y_origin >= rows_above
+            and room_below >= rows_below
+            and x_origin >= columns_left
+            and room_right >= columns_right
+        ):
+            return
+        if y_origin < rows_above:
+            y_origin = max(rows_above, height)
+        if room_below < rows_below:
+            room_below = max(rows_below, height)
+        if x_origin < columns_left:
+            x_origin = max(columns_left, width)
+        if room_right < columns_right:
+            room_right = max(columns_right, width)
+        old_field = self.field
+        self._field_buffer = np.empty(
+            (y_origin + height + room_below, x_origin + width + room_right),
+            dtype=old_field.dtype,
+        )
+        self._set_field(y_origin, x_origin, height, width)[:] = old_field
+
+    def _set_field(self, y_origin: int, x_origin: int, height: int, width: int):
+        """
+        Points field at the given region of the field buffer (and returns it)
+        """
+        self._field_origin = (y_origin, x_origin)
+        self.field = self._field_buffer[
+            y_origin : y_origin + height, x_origin : x_origin + width
+        ]
+        return self.field
+
     def _buffer_field_right(self, to_extend: int) -> None:
         """
         Extends object's noise field right
         """
         # y is just gonna stay the same, but x needs to be picking up
-        max_lin = self.x_lin[-1]
-
-        additional_x_lin = np.linspace(
-            max_lin + self.scale,
-            max_lin + (to_extend * self.scale),
-            to_extend,
-            endpoint=False,
+        additional_x_lin = self._lin(
+            len(self.x_lin) - self.x_negative_buffer, to_extend
         )
-        self.field = np.concatenate(
-            [self.field, self._perlin_field(additional_x_lin, self.y_lin)],
-            axis=1,
+        height, width = self.field.shape
+        self._reserve_field(0, 0, 0, to_extend)
+        y_origin, x_origin = self._field_origin
+        self._perlin_field(
+            additional_x_lin,
+            self.y_lin,
+            out=self._field_buffer[
+                y_origin : y_origin + height,
+                x_origin + width : x_origin + width + to_extend,
+            ],
         )
+        self._set_field(y_origin, x_origin, height, width + to_extend)
         self.x_lin = np.concatenate([self.x_lin, additional_x_lin])
 
     def _buffer_field_bottom(self, to_extend: int) -> None:
         """
         Extends object's noise field downwards
         """
-        max_lin = self.y_lin[-1]
-        additional_y_lin = np.linspace(
-            max_lin + self.scale,
-            max_lin + (to_extend * self.scale),
-            to_extend,
-            endpoint=False,
+        additional_y_lin = self._lin(
+            len(self.y_lin) - self.y_negative_buffer, to_extend
         )
-        self.field = np.concatenate(
-            [self.field, self._perlin_field(self.x_lin, additional_y_lin)],
-            axis=0,
+        height, width = self.field.shape
+        self._reserve_field(0, to_extend, 0, 0)
+        y_origin, x_origin = self._field_origin
+        self._perlin_field(
+            self.x_lin,
+            additional_y_lin,
+            out=self._field_buffer[
+                y_origin + height : y_origin + height + to_extend,
+                x_origin : x_origin + width,
+            ],
         )
+        self._set_field(y_origin, x_origin, height + to_extend, width)
         self.y_lin = np.concatenate([self.y_lin, additional_y_lin])
 
     def _buffer_field_left(self, to_extend: int) -> None:
         """
         Extends object's noise field left
         """
-        min_lin = self.x_lin[0]
-        additional_x_lin = np.linspace(
-            min_lin - (to_extend * self.scale),
-            min_lin,
-            to_extend,
-            endpoint=False,
-        )
-        self.field = np.concatenate(
-            [self._perlin_field(additional_x_lin, self.y_lin), self.field],
-            axis=1,
+        additional_x_lin = self._lin(-self.x_negative_buffer - to_extend, to_extend)
+        height, width = self.field.shape
+        self._reserve_field(0, 0, to_extend, 0)
+        y_origin, x_origin = self._field_origin
+        self._perlin_field(
+            additional_x_lin,
+            self.y_lin,
+            out=self._field_buffer[
+                y_origin : y_origin + height, x_origin - to_extend : x_origin
+            ],
         )
+        self._set_field(y_origin, x_origin - to_extend, height, width + to_extend)
         self.x_lin = np.concatenate([additional_x_lin, self.x_lin])
         self.x_negative_buffer += to_extend
 
@@ -100,164 +278,105 @@ class NoiseField:
         """
         Extends object's noise field upwards
         """
-        min_lin = self.y_lin[0]
-        additional_y_lin = np.linspace(
-            min_lin - (to_extend * self.scale),
-            min_lin,
-            to_extend,
-            endpoint=False,
-        )
-        self.field = np.concatenate(
-            [self._perlin_field(self.x_lin, additional_y_lin), self.field],
-            axis=0,
+        additional_y_lin = self._lin(-self.y_negative_buffer - to_extend, to_extend)
+        height, width = self.field.shape
+        self._reserve_field(to_extend, 0, 0, 0)
+        y_origin, x_origin = self._field_origin
+        self._perlin_field(
+            self.x_lin,
+            additional_y_lin,
+            out=self._field_buffer[
+                y_origin - to_extend : y_origin, x_origin : x_origin + width
+            ],
         )
+        self._set_field(y_origin - to_extend, x_origin, height + to_extend, width)
         self.y_lin = np.concatenate([additional_y_lin, self.y_lin])
         self.y_negative_buffer += to_extend
 
-    def _perlin_field(self, x_lin: List[float], y_lin: List[float]) -> ArrayLike:
+    def _perlin_field(
+        self,
+        x_lin: List[float],
+        y_lin: List[float],
+        out: Optional[ArrayLike] = None,
+    ) -> ArrayLike:
         """
-        generate field from x and y linear points
-
-        credit to tgirod for stack overflow on numpy perlin noise (most of this code from answer)
-        https://stackoverflow.com/questions/42147776/producing-2d-perlin-noise-with-numpy
+        generate field from x and y linear points (into out, if given)
         """
-        # remembering the random state (so we can put it back after)
-        initial_random_state = np.random.get_state()
-        x_grid, y_grid = np.meshgrid(x_lin, y_lin)
-        x_grid %= 512
-        y_grid %= 512
-        # permutation table
-        np.random.seed(self.seed)
-        field_256 = np.arange(256, dtype=int)
-        np.random.shuffle(field_256)
-        field_256 = np.stack([field_256, field_256]).flatten()
-        # coordinates of the top-left
-        x_i, y_i = x_grid.astype(int), y_grid.astype(int)
-        # internal coordinates
-        x_f, y_f = x_grid - x_i, y_grid - y_i
-        # fade factors
-        u_array, v_array = self._fade(x_f), self._fade(y_f)
-        # noise components
-        n00 = self._gradient(field_256[(field_256[x_i % 512] + y_i) % 512], x_f, y_f)
-        n01 = self._gradient(
-            field_256[(field_256[x_i % 512] + y_i + 1) % 512], x_f, y_f - 1
-        )
-        n11 = self._gradient(
-            field_256[(field_256[((x_i % 512) + 1) % 512] + y_i + 1) % 512],
-            x_f - 1,
-            y_f - 1,
-        )
-        n10 = self._gradient(
-            field_256[(field_256[((x_i % 512) + 1) % 512] + y_i) % 512], x_f - 1, y_f
-        )
-        # combine noises
-        x_1 = self._lerp(n00, n10, u_array)
-        x_2 = self._lerp(n01, n11, u_array)
-        # putting the random state back in place
-        np.random.set_state(initial_random_state)
-        field = self._lerp(x_1, x_2, v_array)
-        field += 0.5
-        return field
+        return _perlin(x_lin, y_lin, self._permutation, out=out)
 
-    def _lerp(
-        self, a_array: ArrayLike, b_array: ArrayLike, x_array: ArrayLike
-    ) -> ArrayLike:
-        "linear interpolation"
-        return a_array + x_array * (b_array - a_array)
-
-    def _fade(self, t_array: ArrayLike) -> ArrayLike:
-        "6t^5 - 15t^4 + 10t^3"
-        return 6 * t_array**5 - 15 * t_array**4 + 10 * t_array**3
+    def _initialise_field(self, x_min: int, y_min: int, x_max: int, y_max: int) -> None:
+        """
+        Generates object's noise field in one go, covering the origin and
+        every point from x_min, y_min to x_max, y_max
+        """
+        x_start, y_start = min(x_min, 0), min(y_min, 0)
+        self.x_lin = self._lin(x_start, max(x_max + 1, 1) - x_start)
+        self.y_lin = self._lin(y_start, max(y_max + 1, 1) - y_start)
+        self.field = self._perlin_field(self.x_lin, self.y_lin)
+        self._field_buffer = self.field
+        self._field_origin = (0, 0)
+        self.x_negative_buffer = -x_start
+        self.y_negative_buffer = -y_start
 
-    def _gradient(
-        self, h_array: ArrayLike, x_array: ArrayLike, y_array: ArrayLike
-    ) -> ArrayLike:
-        "grad converts h to the right gradient vector and return the dot product with (x,y)"
-        vectors = np.array([[0, 1], [0, -1], [1, 0], [-1, 0]])
-        g_array = vectors[h_array % 4]
-        return g_array[:, :, 0] * x_array + g_array[:, :, 1] * y_array
+    def _buffer_field_to_cover(
+        self, x_min: int, y_min: int, x_max: int, y_max: int
+    ) -> None:
+        """
+        Extends object's noise field (in buffer_chunks sized steps) as needed
+        so that it covers every point from x_min, y_min to x_max, y_max
+        """
+        if self.field is None:
+            self._initialise_field(x_min, y_min, x_max, y_max)
+            return
+        x_to_backfill = -(x_min + self.x_negative_buffer)
+        if x_to_backfill > 0:
+            self._buffer_field_left(self._roundup(x_to_backfill, self.buffer_chunks))
+        y_to_backfill = -(y_min + self.y_negative_buffer)
+        if y_to_backfill > 0:
+            self._buffer_field_top(self._roundup(y_to_backfill, self.buffer_chunks))
+        height, width = self.field.shape
+        x_to_extend = x_max + self.x_negative_buffer - width + 1
+        if x_to_extend > 0:
+            self._buffer_field_right(self._roundup(x_to_extend, self.buffer_chunks))
+        y_to_extend = y_max + self.y_negative_buffer - height + 1
+        if y_to_extend > 0:
+            self._buffer_field_bottom(self._roundup(y_to_extend, self.buffer_chunks))
 
     def _noise(self, xy_coords: Tuple[int, int]):
         """
         Returns noise of xy coords
         Also manages noise_field (will dynamically recalcuate as needed)
         """
-        if self.scale == 0:
-            return 0
-        x_coord, y_coord = xy_coords
-        x_coord += self.x_negative_buffer
-        y_coord += self.y_negative_buffer
-        if x_coord < 0:
-            # x negative buffer needs to be increased
-            x_to_backfill = self._roundup(abs(x_coord), self.buffer_chunks)
-            self._buffer_field_left(x_to_backfill)
-            x_coord, y_coord = xy_coords
-            x_coord += self.x_negative_buffer
-            y_coord += self.y_negative_buffer
-        if y_coord < 0:
-            # y negative buffer needs to be increased
-            y_to_backfill = self._roundup(abs(y_coord), self.buffer_chunks)
-            self._buffer_field_top(y_to_backfill)
-            x_coord, y_coord = xy_coords
-            x_coord += self.x_negative_buffer
-            y_coord += self.y_negative_buffer
-        try:
-            return self.field[int(y_coord)][int(x_coord)]
-        except IndexError:
-            # ran out of generated noise, so need to extend the field
-            height, width = self.field.shape
-            x_to_extend = x_coord - width + 1
-            y_to_extend = y_coord - height + 1
-            if x_to_extend > 0:
-                x_to_extend = self._roundup(x_to_extend, self.buffer_chunks)
-                self._buffer_field_right(x_to_extend)
-            if y_to_extend > 0:
-                y_to_extend = self._roundup(y_to_extend, self.buffer_chunks)
-                self._buffer_field_bottom(y_to_extend)
-            return self._noise(xy_coords)
+        x_coord, y_coord = math.floor(xy_coords[0]), math.floor(xy_coords[1])
+        self._buffer_field_to_cover(x_coord, y_coord, x_coord, y_coord)
+        return self.field[
+            y_coord + self.y_negative_buffer, x_coord + self.x_negative_buffer
+        ]
 
     def noise_range(self, xy: Tuple[int, int], width: int, height: int):
         """
         Return noise values for a given grid (starting at point xy)
         and covering the stated width and height
         """
-        xy_coords = xy
-        x_coord, y_coord = xy
-        x_coord += width
-        y_coord += height
+        x_coord, y_coord = math.floor(xy[0]), math.floor(xy[1])
+        self._buffer_field_to_cover(
+            x_coord, y_coord, x_coord + width - 1, y_coord + height - 1
+        )
         x_coord += self.x_negative_buffer
         y_coord += self.y_negative_buffer
-        if x_coord < 0:
-            # x negative buffer needs to be increased
-            x_to_backfill = self._roundup(abs(x_coord), self.buffer_chunks)
-            self._buffer_field_left(x_to_backfill)
-            x_coord, y_coord = xy_coords
-            x_coord += self.x_negative_buffer
-            y_coord += self.y_negative_buffer
-        if y_coord < 0:
-            # y negative buffer needs to be increased
-            y_to_backfill = self._roundup(abs(y_coord), self.buffer_chunks)
-            self._buffer_field_top(y_to_backfill)
-            x_coord, y_coord = xy_coords
-            x_coord += self.x_negative_buffer
-            y_coord += self.y_negative_buffer
-        try:
-            _ = self._noise((xy[0] + width, xy[1] + height))
-            return self.field[
-                int(xy[1]) : int(xy[1]) + height, int(xy[0]) : int(xy[0]) + width
-            ]
-        except IndexError:
-            # ran out of generated noise, so need to extend the field
-            height, width = self.field.shape
-            x_to_extend = x_coord - width + 1
-            y_to_extend = y_coord - height + 1
-            if x_to_extend > 0:
-                x_to_extend = self._roundup(x_to_extend, self.buffer_chunks)
-                self._buffer_field_right(x_to_extend)
-            if y_to_extend > 0:
-                y_to_extend = self._roundup(y_to_extend, self.buffer_chunks)
-                self._buffer_field_bottom(y_to_extend)
-            return self.noise_range(xy, width, height)
+        return self.field[y_coord : y_coord + height, x_coord : x_coord + width]
+
+    def noise_points(self, xs: ArrayLike, ys: ArrayLike) -> ArrayLike:
+        """
+        Return noise values for many points at once (given as arrays of
+        x and y coords), rather than asking for each point in turn
+        """
+        xs = np.floor(xs).astype(int)
+        ys = np.floor(ys).astype(int)
+        if xs.size == 0:
+            return np.zeros(xs.shape)
+        self._buffer_field_to_cover(xs.min(), ys.min(), xs.max(), ys.max())
+        return self.field[ys + self.y_negative_buffer, xs + self.x_negative_buffer]
 
 
 def noise_fields(
@@ -4,7 +4,7 @@ shades
 functions to be used for pixel level color generation with Canvas object
 """
 
-from typing import Tuple, Callable
+from typing import Tuple, Callable, Optional
 from functools import cache
 
 import numpy as np
@@ -15,17 +15,20 @@ from shades.noise import noise_fields, NoiseField
 def block_color(color: Tuple[int, int, int]) -> Callable:
     """
     Creates a shade that shades everything with a block color
+
+    The shade returns a read only (broadcast) array, so take a copy of it
+    first if you want to change its values in place.
     """
+    block = np.array(color, dtype=float)
 
     def shade(xy: Tuple[int, int], width: int, height: int) -> np.ndarray:
         """
         shade everything a single block color
+
+        (returned as a read only broadcast of the one color, so no memory
+        is spent on a full block of identical pixels)
         """
-        return np.full(
-            (height, width, 3),
-            color,
-            dtype=float,
-        )
+        return np.broadcast_to(block, (height, width, 3))
 
     return shade
 
@@ -33,7 +36,7 @@ def block_color(color: Tuple[int, int, int]) -> Callable:
 def gradient(
     color: Tuple[int, int, int] = (200, 200, 200),
     color_variance: int = 70,
-    color_fields: Tuple[NoiseField, NoiseField, NoiseField] = noise_fields(channels=3),
+    color_fields: Optional[Tuple[NoiseField, NoiseField, NoiseField]] = None,
 ) -> Callable:
     """
     Creates a shade where colors vary based on noise fields
@@ -41,21 +44,30 @@ def gradient(
     color variance relate the amount a color will vary at the maximum
     noise point. color_variance of 100, means that noise will vary the
     tone of each channel (as in RGB) by up to 100.
+
+    color_fields default to three new noise fields for each gradient.
     """
+    if color_fields is None:
+        color_fields = noise_fields(channels=3)
 
     def shade(xy: Tuple[int, int], width: int, height: int) -> np.ndarray:
         """
         shade varying based on noise fields
         """
-        noise_ranges = np.array(
-            [i.noise_range(xy, width, height) for i in color_fields]
-        )
-        noise_ranges = np.transpose(noise_ranges, (1, 2, 0))
-        noise_ranges -= 0.5
-        noise_ranges *= color_variance * 2
-        colors = np.full((height, width, 3), color, dtype=float)
-        # TODO: clamp these colors to 0.1 - 255 range
-        return colors + noise_ranges
+        colors = np.empty((height, width, 3), dtype=float)
+        # each channel is written straight into place, rather than stacking
+        # the noise, transposing it and then adding it to a block color.
+        # color + (noise - 0.5) * 2 * variance is rearranged so that the
+        # noise only needs one multiply and one add, with no temporaries
+        for channel, field in enumerate(color_fields):
+            np.multiply(
+                field.noise_range(xy, width, height),
+                color_variance * 2,
+                out=colors[:, :, channel],
+            )
+            colors[:, :, channel] += color[channel] - color_variance
+        # keep colors in range, so they don't wrap around when cast to bytes
+        return np.clip(colors, 0, 255, out=colors)
 
     return shade
 
@@ -79,12 +91,10 @@ def custom_shade(
         """
         Custom defined shade
         """
-        colors = []
-        for x in range(xy[0], xy[0] + height):
-            row = []
-            for y in range(xy[1], xy[1] + width):
-                row.append(custom_function((x, y)))
-            colors.append(row)
-        return np.array(colors)
+        colors = np.empty((height, width, 3), dtype=float)
+        for row, y in enumerate(range(xy[1], xy[1] + height)):
+            for column, x in enumerate(range(xy[0], xy[0] + width)):
+                colors[row, column] = custom_function((x, y))
+        return colors
 
     return shade
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 from shades import canvas
+from shades.noise import NoiseField
 from shades.shades import block_color
 
 
@@ -33,6 +34,18 @@ def test_grid_provides_correctly_spaces_xy_coords(canvas_obj):
     assert actual == {(0, 0), (0, 10), (10, 10), (10, 0)}
 
 
+def test_grid_array_matches_grid(canvas_obj):
+    for x_first in [True, False]:
+        actual = canvas_obj.grid_array(3, 4, x_first=x_first).tolist()
+        expected = [list(i) for i in canvas_obj.grid(3, 4, x_first=x_first)]
+        assert actual == expected
+
+
+def test_fill_shades_whole_canvas(small_canvas):
+    actual = small_canvas.fill(block_color((1, 2, 3)))._image_array
+    assert (actual == (1, 2, 3)).all()
+
+
 def test_rectangle_draws_expected_shape(small_canvas, black):
     actual = small_canvas.rectangle(black, (1, 1), 2, 1)._stack[0][1]
     assert (actual == np.array([[0, 0, 0], [0, 1, 1], [0, 0, 0]])).all()
@@ -89,3 +102,151 @@ def test_circle_draws_expected_shape(small_canvas, black):
 def test_circle_outline_draws_expected_shape(small_canvas, black):
     actual = small_canvas.circle_outline(black, (1, 1), 2)._stack[0][1]
     assert (actual == np.array([[0, 0, 0], [0, 0, 0], [0, 0, 1]])).all()
+
+
+def test_rectangle_outlines_draws_each_outline_with_its_shade(black):
+    canvas_obj = canvas.Canvas(7, 4, (100, 100, 100))
+    white = block_color((255, 255, 255))
+    canvas_obj.rectangle_outlines([black, white], [(0, 0), (4, 0)], 2, 2)
+    actual = canvas_obj._image_array[:, :, 0]
+    expected = np.array(
+        [
+            [0, 0, 0, 100, 255, 255, 255],
+            [0, 100, 0, 100, 255, 100, 255],
+            [0, 0, 0, 100, 255, 255, 255],
+            [100, 100, 100, 100, 100, 100, 100],
+        ]
+    )
+    assert (actual == expected).all()
+
+
+def test_image_reflects_drawing_after_earlier_render(canvas_obj, black):
+    canvas_obj.image()
+    canvas_obj.rectangle_outlines([black], [(2, 2)], 2, 2)
+    assert canvas_obj.image().getpixel((2, 2)) == (0, 0, 0)
+
+
+def test_for_grid_draw_calls_method_at_each_grid_point(canvas_obj, black):
+    canvas_obj.for_grid(5).draw("circle", black, 0)
+    actual = np.argwhere(canvas_obj._image_array[:, :, 2] == 0).tolist()
+    assert actual == [[0, 0], [0, 5], [5, 0], [5, 5]]
+
+
+def test_circle_is_clipped_to_canvas(canvas_obj, black):
+    canvas_obj.circle(black, (8, 1), 3)
+    i, j = np.ogrid[:10, :10]
+    expected = (i - 1) ** 2 + (j - 8) ** 2 <= 9
+    assert ((canvas_obj._image_array[:, :, 2] == 0) == expected).all()
+
+
+def test_line_covers_each_step_along_longest_axis(canvas_obj, black):
+    canvas_obj.line(black, (0, 0), (9, 3))
+    actual = np.argwhere(canvas_obj._image_array[:, :, 2] == 0)
+    assert len(actual) == 10
+    assert [0, 0] in actual.tolist() and [3, 9] in actual.tolist()
+
+
+def test_rectangle_is_clipped_to_canvas(canvas_obj, black):
+    canvas_obj.rectangle(black, (-2, 7), 4, 5)
+    actual = np.argwhere(canvas_obj._image_array[:, :, 2] == 0)
+    assert actual.min(axis=0).tolist() == [7, 0]
+    assert actual.max(axis=0).tolist() == [9, 1]
+    assert len(actual) == 6
+
+
+def test_image_clamps_out_of_range_colors(canvas_obj):
+    canvas_obj.fill(lambda xy, width, height: np.full((height, width, 3), 300.0))
+    assert canvas_obj.image().getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_drawing_entirely_off_canvas_leaves_it_unchanged(canvas_obj, black):
+    canvas_obj.line(black, (-10, -10), (-2, -5))
+    canvas_obj.polygon(black, (20, 20), (30, 20), (30, 30))
+    assert (canvas_obj._image_array == (0, 0, 255)).all()
+
+
+def test_weighted_line_draws_square_at_each_point(canvas_obj, black):
+    canvas_obj.line(black, (2, 2), (2, 2), weight=3)
+    actual = np.argwhere(canvas_obj._image_array[:, :, 2] == 0)
+    assert actual.min(axis=0).tolist() == [2, 2]
+    assert actual.max(axis=0).tolist() == [4, 4]
+    assert len(actual) == 9
+
+
+def test_points_in_line_are_contiguous_and_hit_both_ends(canvas_obj):
+    actual = canvas_obj._points_in_line((5, 2), (-7, 11))
+    assert actual[0].tolist() == [5, 2] and actual[-1].tolist() == [-7, 11]
+    assert (np.abs(np.diff(actual, axis=0)) <= 1).all()
+
+
+def test_polygon_fills_inside_of_shape(canvas_obj, black):
+    canvas_obj.polygon(black, (0, 0), (9, 0), (0, 9))
+    actual = canvas_obj._image_array[:, :, 2] == 0
+    i, j = np.ogrid[:10, :10]
+    assert (actual == (i + j <= 9)).all()
+
+
+def test_warped_line_with_no_shift_matches_line(canvas_obj, black):
+    expected = canvas.Canvas(10, 10, (0, 0, 255)).line(black, (1, 1), (8, 6))
+    warp_noise = (NoiseField(seed=1), NoiseField(seed=2))
+    canvas_obj.warped_line(black, (1, 1), (8, 6), warp_noise, 0)
+    assert (canvas_obj._image_array == expected._image_array).all()
+
+
+def test_warped_line_with_zero_scale_noise_stays_put(canvas_obj, black):
+    expected = canvas.Canvas(10, 10, (0, 0, 255)).line(black, (1, 5), (8, 5))
+    warp_noise = (NoiseField(scale=0), NoiseField(scale=0))
+    canvas_obj.warped_line(black, (1, 5), (8, 5), warp_noise, 3)
+    assert (canvas_obj._image_array == expected._image_array).all()
+
+
+def test_rectangle_outline_draws_only_the_edges(canvas_obj, black):
+    canvas_obj.rectangle_outline(black, (2, 3), 5, 4)
+    actual = canvas_obj._image_array[:, :, 2] == 0
+    expected = np.zeros((10, 10), dtype=bool)
+    expected[3:8, 2:8] = True
+    expected[4:7, 3:7] = False
+    assert (actual == expected).all()
+
+
+def test_rectangle_outlines_off_the_top_left_dont_wrap(canvas_obj, black):
+    canvas_obj.rectangle_outlines([black], [(-8, -8)], 3, 3)
+    assert (canvas_obj._image_array == (0, 0, 255)).all()
+
+
+def test_rotated_rectangle_turns_around_corner(canvas_obj, black):
+    canvas_obj.rectangle(black, (5, 2), 4, 1, rotation=90)
+    actual = np.argwhere(canvas_obj._image_array[:, :, 2] == 0).tolist()
+    assert actual == [[2, 5], [3, 5], [4, 5], [5, 5]]
+
+
+def test_rotated_line_with_no_weight_draws_nothing(canvas_obj, black):
+    canvas_obj.line(black, (1, 1), (8, 6), weight=0, rotation=10)
+    assert (canvas_obj._image_array == (0, 0, 255)).all()
+
+
+def test_circle_outline_with_no_radius_draws_nothing(canvas_obj, black):
+    canvas_obj.circle_outline(black, (5, 5), 0)
+    assert (canvas_obj._image_array == (0, 0, 255)).all()
+
+
+def test_warped_triangle_outline_turns_its_corners(canvas_obj, black):
+    warp_noise = (NoiseField(seed=1), NoiseField(seed=2))
+    expected = canvas.Canvas(10, 10, (0, 0, 255)).warped_triangle_outline(
+        black, (5, 5), (5, 8), (2, 5), warp_noise, 0
+    )
+    canvas_obj.warped_triangle_outline(
+        black, (5, 5), (8, 5), (5, 8), warp_noise, 0, rotation=90
+    )
+    assert (canvas_obj._image_array == expected._image_array).all()
+
+
+def test_polygon_with_no_points_draws_nothing(canvas_obj, black):
+    canvas_obj.polygon(black)
+    canvas_obj.polygon(black, rotation=20)
+    assert (canvas_obj._image_array == (0, 0, 255)).all()
+
+
+def test_canvas_color_is_clamped_to_0_to_255():
+    canvas_obj = canvas.Canvas(2, 2, (300, -5, 128))
+    assert (canvas_obj._image_array == (255, 0, 128)).all()
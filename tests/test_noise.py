@@ -3,6 +3,7 @@ tests for shades.noise module
 """
 from shades import noise
 
+import numpy as np
 import pytest
 
 @pytest.fixture
@@ -29,4 +30,48 @@ def test_noise_fields_can_take_list_of_scale():
 def test_noise_fields_can_take_list_of_seeds():
     actual = noise.noise_fields(seed=[1, 2, 3], channels=3)
     assert {i.seed for i in actual} == {1, 2, 3}
-    
+
+def test_noise_field_leaves_global_random_state_alone():
+    np.random.seed(3)
+    expected = np.random.rand()
+    np.random.seed(3)
+    noise.NoiseField(seed=5).noise_range((0, 0), 10, 10)
+    assert np.random.rand() == expected
+
+def test_noise_fields_with_same_seed_match():
+    actual = noise.NoiseField(seed=5).noise_range((0, 0), 10, 10)
+    also_actual = noise.NoiseField(seed=5).noise_range((0, 0), 10, 10)
+    assert (actual == also_actual).all()
+
+def test_buffered_noise_field_matches_field_generated_in_one_go(field):
+    field.noise_range((0, 0), 1200, 700)
+    field._noise((-20, -30))
+    height, width = field.field.shape
+    actual = field._perlin_field(
+        field._lin(-field.x_negative_buffer, width),
+        field._lin(-field.y_negative_buffer, height),
+    )
+    assert (actual == field.field).all()
+
+def test_noise_range_matches_noise_at_each_point(field):
+    field._noise((-600, -10))
+    actual = field.noise_range((-30, -20), 40, 50)
+    assert actual[0][0] == field._noise((-30, -20))
+    assert actual[49][39] == field._noise((9, 29))
+
+def test_noise_field_is_generated_on_first_use_at_requested_size(field):
+    assert field.field is None
+    field.noise_range((-5, 0), 30, 20)
+    assert field.field.shape == (20, 30)
+
+def test_noise_points_matches_noise_at_each_point(field):
+    actual = field.noise_points(np.array([0, -40, 700]), np.array([3, 900, -2]))
+    expected = [field._noise(i) for i in [(0, 3), (-40, 900), (700, -2)]]
+    assert (actual == expected).all()
+
+
+def test_zero_scale_noise_is_the_same_through_every_lookup():
+    field = noise.NoiseField(scale=0)
+    assert field._noise((3, -4)) == 0.5
+    assert (field.noise_range((-2, 1), 3, 2) == 0.5).all()
+    assert (field.noise_points(np.array([5, -1]), np.array([0, 7])) == 0.5).all()
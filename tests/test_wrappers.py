@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 from shades import _wrappers
 
 def test_cast_int_converts_floats_based_on_type_hints():
@@ -29,3 +29,10 @@ def test_case_int_works_also_on_tuple_of_ints_of_two_or_three_length():
         assert isinstance(two, int)
         assert isinstance(three, int)
     some_function((3.4, 3.1, 1.1))
+
+def test_cast_int_leaves_optional_none_and_keyword_args_alone():
+    @_wrappers.cast_ints
+    def some_function(a: Optional[int] = None, b: int = 0):
+        return a, b
+    assert some_function(None, b=2.2) == (None, 2)
+    assert some_function(a=1.6) == (2, 0)